@@ -1,14 +1,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
-import yaml
-from datetime import datetime, timedelta
+import functools
 import os
-from typing import Dict, List, Tuple
+from datetime import datetime
+from typing import Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; configs then parse with the stdlib json
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -51,6 +55,86 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+class Cols:
+    """Column names of the simulation results, shared by the simulator and the pages"""
+    DATE = 'Date'
+    WEEK = 'Week'
+    REVENUE = 'RPC_Revenue_USD'
+    TRX_BUYBACK = 'TRX_Buyback_USD'
+    ANKR_BUYBACK = 'ANKR_Buyback_USD'
+    TRX_UNITS = 'TRX_Units'
+    ANKR_UNITS = 'ANKR_Units'
+    WEEKLY_LP = 'Weekly_LP_Value_USD'
+    CUM_DEV_LP = 'Cumulative_RPCfi_LP_USD'
+    TOTAL_TVL = 'Total_LP_TVL_USD'
+    DEV_YIELD = 'Dev_Weekly_Yield_USD'
+    FOUNDATION_YIELD = 'Foundation_Weekly_Yield_USD'
+    CUM_DEV_YIELD = 'Cumulative_Dev_Yield_USD'
+    CUM_FOUNDATION_YIELD = 'Cumulative_Foundation_Yield_USD'
+
+def _sim_kernel(weekly_lp_value: np.ndarray, weekly_rate: float) -> Tuple:
+    """Weekly developer LP/yield recurrence with yield reinvested into LP"""
+    n = weekly_lp_value.shape[0]
+    cum_dev_lp = np.empty(n)
+    dev_yield = np.empty(n)
+    cum_dev_yield = np.empty(n)
+    lp = 0.0
+    total_yield = 0.0
+    for i in range(n):
+        lp += weekly_lp_value[i]
+        week_yield = lp * weekly_rate
+        total_yield += week_yield
+        lp += week_yield
+        cum_dev_lp[i] = lp
+        dev_yield[i] = week_yield
+        cum_dev_yield[i] = total_yield
+    return cum_dev_lp, dev_yield, cum_dev_yield
+
+@functools.lru_cache(maxsize=None)
+def _compiled_sim_kernel():
+    """_sim_kernel JIT-compiled with numba, or as plain Python without it"""
+    # Imported here, not at module load: numba is slow to import and only the
+    # reinvesting simulation needs it (as with yaml in _read_config)
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; the kernel then runs as plain Python
+        return _sim_kernel
+    return njit(cache=True)(_sim_kernel)
+
+@functools.lru_cache(maxsize=8)
+def _future_revenue(base_revenue: float, future_growth_multiplier: float,
+                    start_str: str, end_str: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Month start dates and revenue of the growth ramp, memoized on its inputs"""
+    # One entry per calendar month in the simulation period
+    start_date = datetime.strptime(start_str, '%Y-%m-%d')
+    end_date = datetime.strptime(end_str, '%Y-%m-%d')
+    first_month = np.datetime64(start_date, 'M')
+    last_month = np.datetime64(end_date, 'M')
+    # Months are stepped on the start date's day of month, so the end month only
+    # counts once that day is reached
+    if end_date.day < start_date.day:
+        last_month -= 1
+    months = np.arange(first_month, last_month + 1).astype('datetime64[D]')
+
+    # Linear ramp from 1.0 to future_growth_multiplier over the period
+    if len(months) > 1:
+        growth_factor = np.linspace(1.0, future_growth_multiplier, len(months))
+    else:
+        growth_factor = np.ones(len(months))
+
+    monthly_revenue = base_revenue * growth_factor
+
+    # The cached arrays are shared between callers, so keep them read-only
+    months.setflags(write=False)
+    monthly_revenue.setflags(write=False)
+    return months, monthly_revenue
+
+def _expand_to_weeks(months: np.ndarray, monthly_revenue: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split each month into 4 weeks, 7 days apart, with equal weekly revenue"""
+    weekly_revenue = monthly_revenue / 4.33  # Approximate weeks per month
+    week_offsets = np.tile(np.arange(4) * 7, len(months)).astype('timedelta64[D]')
+    return np.repeat(months, 4) + week_offsets, np.repeat(weekly_revenue, 4)
+
 class RPCfiSimulator:
     def __init__(self, config: Dict):
         self.config = config
@@ -67,32 +151,33 @@ class RPCfiSimulator:
             'best': 40.0
         })
         self.historical_data = config.get('historical_data', {})
+        self.reinvest_yield = config.get('reinvest_yield', False)
+        self.foundation_lp_value = sum(self.initial_lp.values())
+        self._trx_price = float(self.token_prices[self.native_token])
+        self._ankr_price = float(self.token_prices[self.governance_token])
+        self._weekly_rate = {k: v / 100 / 52 for k, v in self.apy_scenarios.items()}
         
         # Initialize simulation data
         self.simulation_data = None
         self.weekly_data = None
         
-    def load_revenue_data(self, revenue_data: Dict[str, float]) -> pd.DataFrame:
+    @staticmethod
+    def load_revenue_data(revenue_data: Dict[str, float]) -> pd.DataFrame:
         """Load and process monthly revenue data"""
-        df = pd.DataFrame(list(revenue_data.items()), columns=['Month', 'RPC_Revenue_USD'])
-        df['Month'] = pd.to_datetime(df['Month'])
-        df = df.sort_values('Month')
+        # Parse the 'YYYY-MM' keys (zero-padding optional) and sort chronologically
+        items = sorted(
+            (datetime.strptime(month, '%Y-%m'), revenue) for month, revenue in revenue_data.items()
+        )
+        months = np.array([month for month, _ in items], dtype='datetime64[M]').astype('datetime64[D]')
+        monthly_revenue = np.array([revenue for _, revenue in items], dtype=np.float64)
         
-        # Convert monthly to weekly data
-        weekly_data = []
-        for _, row in df.iterrows():
-            monthly_revenue = row['RPC_Revenue_USD']
-            weekly_revenue = monthly_revenue / 4.33  # Approximate weeks per month
-            
-            # Generate 4 weeks for each month
-            for week in range(4):
-                week_date = row['Month'] + timedelta(weeks=week)
-                weekly_data.append({
-                    'Date': week_date,
-                    'RPC_Revenue_USD': weekly_revenue
-                })
+        # Convert monthly to weekly data: 4 weeks per month, 7 days apart
+        dates, weekly_revenue = _expand_to_weeks(months, monthly_revenue)
         
-        return pd.DataFrame(weekly_data)
+        return pd.DataFrame({
+            Cols.DATE: dates,
+            Cols.REVENUE: weekly_revenue
+        })
     
     
     def calculate_buybacks(self, weekly_revenue: float) -> Tuple[float, float]:
@@ -106,140 +191,150 @@ class RPCfiSimulator:
     
     def calculate_lp_units(self, trx_buyback: float, ankr_buyback: float) -> Tuple[float, float]:
         """Calculate LP units from buyback amounts"""
-        trx_price = self.token_prices[self.native_token]
-        ankr_price = self.token_prices[self.governance_token]
-        
-        trx_units = trx_buyback / trx_price
-        ankr_units = ankr_buyback / ankr_price
+        trx_units = trx_buyback / self._trx_price
+        ankr_units = ankr_buyback / self._ankr_price
         
         return trx_units, ankr_units
     
     def calculate_lp_value(self, trx_units: float, ankr_units: float) -> float:
         """Calculate LP value in USD"""
-        trx_price = self.token_prices[self.native_token]
-        ankr_price = self.token_prices[self.governance_token]
-        
         # LP value is the total value of both tokens in the pair
-        return trx_units * trx_price + ankr_units * ankr_price
+        return trx_units * self._trx_price + ankr_units * self._ankr_price
     
     def calculate_yield(self, lp_value: float, apy: float) -> float:
         """Calculate weekly yield from LP value"""
         weekly_yield = lp_value * (apy / 100) / 52
         return weekly_yield
     
-    def generate_future_revenue_data(self) -> Dict[str, float]:
-        """Generate future monthly revenue data using modular growth assumptions."""
+    def _revenue_params(self) -> Tuple[float, str, str]:
+        """Base monthly revenue and simulation period bounds"""
         # Read simulation period from config (fallback to 2026-2027)
         sim_period = self.config.get('simulation_period', {})
         start_str = sim_period.get('start', '2026-01-01')
         end_str = sim_period.get('end', '2027-12-31')
-        start_date = datetime.strptime(start_str, '%Y-%m-%d')
-        end_date = datetime.strptime(end_str, '%Y-%m-%d')
 
         # Base revenue: last historical month, scaled by initial growth multiplier
         if self.historical_data:
-            last_month_revenue = list(self.historical_data.values())[-1]
+            last_month_revenue = next(reversed(self.historical_data.values()))
         else:
             last_month_revenue = 35000.0
         base_revenue = last_month_revenue * self.growth_multiplier
 
-        revenue_data = {}
-        current_date = start_date
-
-        # Linear ramp from 1.0 to expected_future_growth_multiplier over the period
-        while current_date <= end_date:
-            months_elapsed = (current_date.year - start_date.year) * 12 + (current_date.month - start_date.month)
-            total_months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-            if total_months > 0:
-                growth_factor = 1.0 + (self.expected_future_growth_multiplier - 1.0) * (months_elapsed / total_months)
-            else:
-                growth_factor = 1.0
+        return base_revenue, start_str, end_str
 
-            monthly_revenue = base_revenue * growth_factor
-            month_key = current_date.strftime('%Y-%m')
-            revenue_data[month_key] = monthly_revenue
-
-            # Next month
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1)
-
-        return revenue_data
+    def generate_future_revenue_data(self) -> Dict[str, float]:
+        """Generate future monthly revenue data using modular growth assumptions."""
+        base_revenue, start_str, end_str = self._revenue_params()
+        months, monthly_revenue = _future_revenue(
+            base_revenue, self.expected_future_growth_multiplier, start_str, end_str
+        )
+        return dict(zip(np.datetime_as_string(months, unit='M').tolist(), monthly_revenue.tolist()))
     
     
     def run_simulation(self, apy_scenario: str = 'base') -> pd.DataFrame:
-        """Run the complete simulation"""
-        # Generate future revenue data
-        revenue_data = self.generate_future_revenue_data()
-        
-        # Load and process revenue data
-        weekly_df = self.load_revenue_data(revenue_data)
-        total_weeks = len(weekly_df)
-        
-        # Get APY for selected scenario
-        apy = self.apy_scenarios[apy_scenario]
-        
-        # Initialize simulation results
-        results = []
-        cumulative_dev_lp = 0
-        cumulative_dev_yield = 0
-        cumulative_foundation_yield = 0
-        
-        # Foundation LP values
-        foundation_lp_value = sum(self.initial_lp.values())
+        """Run the complete simulation (cached per set of input values)"""
+        base_revenue, start_str, end_str = self._revenue_params()
+        self.simulation_data = _simulate(
+            self._trx_price,
+            self._ankr_price,
+            self.foundation_lp_value,
+            base_revenue,
+            self.expected_future_growth_multiplier,
+            self._weekly_rate[apy_scenario],
+            start_str,
+            end_str,
+            self.reinvest_yield
+        )
+        return self.simulation_data
+
+@st.cache_data(ttl=3600)
+def _simulate(trx_price: float, ankr_price: float, foundation_lp_value: float,
+              base_revenue: float, future_growth_multiplier: float, weekly_rate: float,
+              start_str: str, end_str: str, reinvest_yield: bool) -> pd.DataFrame:
+    """Compute the weekly simulation results, reused across reruns for the same inputs"""
+    # Generate future revenue data and split it into weeks, as plain arrays
+    months, monthly_revenue = _future_revenue(base_revenue, future_growth_multiplier, start_str, end_str)
+    dates, revenue = _expand_to_weeks(months, monthly_revenue)
+    
+    # The per-week math below is pure array ops
+    # (calculate_buybacks/lp_units/lp_value/yield remain as scalar helpers)
+    # Use the revenue directly (growth already applied at monthly level)
+    n_weeks = len(revenue)
+    weeks = np.arange(1, n_weeks + 1)
+    
+    # Buybacks from each week's revenue (25% TRX, 25% ANKR)
+    trx_buyback = 0.25 * revenue
+    ankr_buyback = 0.25 * revenue
+    
+    # LP units and value from each week's buybacks
+    trx_units = trx_buyback / trx_price
+    ankr_units = ankr_buyback / ankr_price
+    # Units are bought at the same prices they are valued at, so the prices cancel
+    # and the LP value is simply the 50% buyback pool
+    weekly_lp_value = 0.50 * revenue
+    
+    if reinvest_yield:
+        # Developer yield compounds into LP, so each week depends on the last
+        cumulative_dev_lp, dev_yield, cumulative_dev_yield = _compiled_sim_kernel()(
+            weekly_lp_value, weekly_rate
+        )
+    else:
+        # Cumulative developer LP (only grows from new deposits, no compounding).
+        # The 4 weeks of a month deposit the same amount, so accumulate per month
+        # and add the within-month deposits when expanding back to weeks
+        month_lp_per_week = weekly_lp_value[::4]
+        month_start_lp = np.cumsum(4 * month_lp_per_week) - 4 * month_lp_per_week
+        week_of_month = np.tile(np.arange(1, 5), len(month_lp_per_week))
+        cumulative_dev_lp = np.repeat(month_start_lp, 4) + week_of_month * np.repeat(month_lp_per_week, 4)
         
-        for week_num, (_, row) in enumerate(weekly_df.iterrows()):
-            # Use the revenue directly (growth already applied at monthly level)
-            weekly_revenue = row['RPC_Revenue_USD']
-            
-            # Calculate buybacks from current week's revenue
-            trx_buyback, ankr_buyback = self.calculate_buybacks(weekly_revenue)
-            
-            # Calculate LP units and value from this week's buybacks
-            trx_units, ankr_units = self.calculate_lp_units(trx_buyback, ankr_buyback)
-            weekly_lp_value = self.calculate_lp_value(trx_units, ankr_units)
-            
-            # Update cumulative developer LP (only grows from new deposits, no compounding)
-            cumulative_dev_lp += weekly_lp_value
-            
-            # Calculate yields based on current LP values (yield doesn't compound into LP)
-            dev_yield = self.calculate_yield(cumulative_dev_lp, apy)
-            foundation_yield = self.calculate_yield(foundation_lp_value, apy)
-            
-            # Update cumulative yields (yields are paid out, not reinvested)
-            cumulative_dev_yield += dev_yield
-            cumulative_foundation_yield += foundation_yield
-            
-            # Store results
-            results.append({
-                'Date': row['Date'],
-                'Week': week_num + 1,
-                'RPC_Revenue_USD': weekly_revenue,
-                'TRX_Buyback_USD': trx_buyback,
-                'ANKR_Buyback_USD': ankr_buyback,
-                'TRX_Units': trx_units,
-                'ANKR_Units': ankr_units,
-                'Weekly_LP_Value_USD': weekly_lp_value,
-                'Cumulative_RPCfi_LP_USD': cumulative_dev_lp,
-                'Total_LP_TVL_USD': cumulative_dev_lp + foundation_lp_value,
-                'Dev_Weekly_Yield_USD': dev_yield,
-                'Foundation_Weekly_Yield_USD': foundation_yield,
-                'Cumulative_Dev_Yield_USD': cumulative_dev_yield,
-                'Cumulative_Foundation_Yield_USD': cumulative_foundation_yield
-            })
+        # Yields based on current LP values (yield doesn't compound into LP)
+        dev_yield = cumulative_dev_lp * weekly_rate
         
-        self.simulation_data = pd.DataFrame(results)
-        return self.simulation_data
+        # Cumulative yields (yields are paid out, not reinvested)
+        cumulative_dev_yield = np.cumsum(dev_yield)
+    
+    # Foundation LP is static, so its yield is the same every week
+    foundation_weekly_yield = foundation_lp_value * weekly_rate
+    foundation_yield = np.full(n_weeks, foundation_weekly_yield)
+    cumulative_foundation_yield = weeks * foundation_weekly_yield
+    
+    # USD amounts stay float64: the tables show them to the cent, and float32 drops
+    # cents once values pass ~$131k. Only the token unit columns are downcast
+    return pd.DataFrame({
+        Cols.DATE: dates.astype('datetime64[ns]'),
+        Cols.WEEK: weeks.astype(np.int32),
+        Cols.REVENUE: revenue,
+        Cols.TRX_BUYBACK: trx_buyback,
+        Cols.ANKR_BUYBACK: ankr_buyback,
+        Cols.TRX_UNITS: trx_units.astype(np.float32),
+        Cols.ANKR_UNITS: ankr_units.astype(np.float32),
+        Cols.WEEKLY_LP: weekly_lp_value,
+        Cols.CUM_DEV_LP: cumulative_dev_lp,
+        Cols.TOTAL_TVL: cumulative_dev_lp + foundation_lp_value,
+        Cols.DEV_YIELD: dev_yield,
+        Cols.FOUNDATION_YIELD: foundation_yield,
+        Cols.CUM_DEV_YIELD: cumulative_dev_yield,
+        Cols.CUM_FOUNDATION_YIELD: cumulative_foundation_yield
+    })
+
+@st.cache_data
+def _read_config(config_file: str, mtime: float) -> Dict:
+    """Parse a JSON or YAML config file once per modification time; each caller gets its own copy"""
+    if config_file.endswith('.yaml') or config_file.endswith('.yml'):
+        with open(config_file, 'r') as f:
+            import yaml  # only needed for YAML configs; the default config is JSON
+            return yaml.safe_load(f)
+    with open(config_file, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 def load_config(config_file: str) -> Dict:
     """Load configuration from JSON or YAML file"""
+    # Errors are reported here rather than inside the cached reader, so they
+    # are shown on every rerun and a failed read is never cached
     try:
-        with open(config_file, 'r') as f:
-            if config_file.endswith('.yaml') or config_file.endswith('.yml'):
-                return yaml.safe_load(f)
-            else:
-                return json.load(f)
+        # The modification time is part of the cache key, so edits are picked up
+        return _read_config(config_file, os.path.getmtime(config_file))
     except FileNotFoundError:
         st.error(f"Config file {config_file} not found!")
         return None
@@ -247,6 +342,11 @@ def load_config(config_file: str) -> Dict:
         st.error(f"Error loading config: {e}")
         return None
 
+@st.cache_data
+def _assets_present() -> Dict[str, bool]:
+    """Check once which logo images are available"""
+    return {name: os.path.exists(name) for name in ('trx.png', 'ankr.png', 'rpcfi.png')}
+
 def get_default_revenue_data() -> Dict[str, float]:
     """Get default revenue data for demonstration"""
     return {
@@ -258,30 +358,47 @@ def get_default_revenue_data() -> Dict[str, float]:
         "2025-09": 35000.0
     }
 
+def get_simulator(config_path: str) -> RPCfiSimulator:
+    """Get this session's simulator, rebuilding it whenever the config file changes"""
+    # Kept per session rather than in st.cache_resource: the About tab mutates the
+    # growth multipliers, which must not leak into other users' sessions. Those are
+    # re-applied from session state on every rerun, so a rebuild after the config
+    # file is edited loses nothing
+    key = f'simulator_{config_path}'
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        mtime = None
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != mtime:
+        config = load_config(config_path)
+        if config is None:
+            return None
+        st.session_state[key] = (mtime, RPCfiSimulator(config))
+    return st.session_state[key][1]
+
 def main():
-    # Load Tron configuration
-    config = load_config('config_tron.json')
-    if config is None:
+    # Load Tron configuration and simulator
+    simulator = get_simulator('config_tron.json')
+    if simulator is None:
         st.error("Configuration file not found!")
         return
     
     # Main header with logos - better positioning
     col1, col2, col3 = st.columns([0.8, 2.4, 0.8])
+    assets = _assets_present()
     
     with col1:
-        if os.path.exists('trx.png'):
+        if assets['trx.png']:
             st.image('trx.png', width=50)
     
     with col2:
         st.markdown('<div class="main-header">RPCfi Flow Simulator</div>', unsafe_allow_html=True)
     
     with col3:
-        if os.path.exists('ankr.png'):
+        if assets['ankr.png']:
             st.image('ankr.png', width=50)
     
-    # Initialize simulator
-    simulator = RPCfiSimulator(config)
-    
     # Main content area
     tab1, tab2, tab3, tab4 = st.tabs(["About RPCfi", "Overview", "Buyback & LP Flows", "Yield & Revenue"])
     
@@ -302,7 +419,7 @@ def show_about_page(simulator: RPCfiSimulator):
     st.header("About RPCfi")
     
     # RPCfi logo if available
-    if os.path.exists('rpcfi.png'):
+    if _assets_present()['rpcfi.png']:
         st.image('rpcfi.png', width=1000)
     
     st.markdown("""
@@ -433,6 +550,13 @@ def show_about_page(simulator: RPCfiSimulator):
     st.session_state["rpcfi_growth_future_multiplier"] = scenario["future"]
     st.session_state["rpcfi_selected_growth_scenario"] = selected_scenario
 
+    if simulator.reinvest_yield:
+        lp_growth = "LP grows from new buyback deposits and reinvested yield (auto-compounding)"
+        yield_use = "Yields are reinvested into LP (not paid out)"
+    else:
+        lp_growth = "LP grows from new buyback deposits (no auto-compounding)"
+        yield_use = "Yields are paid out (not reinvested)"
+
     st.markdown(f"""
     **Selected Scenario: {selected_scenario}**
 
@@ -456,8 +580,8 @@ def show_about_page(simulator: RPCfiSimulator):
 
     **Key Mechanics:**
     - All buybacks are converted to LP tokens (TRX/ANKR pairs)
-    - LP grows from new buyback deposits (no auto-compounding)
-    - Yields are paid out (not reinvested)
+    - {lp_growth}
+    - {yield_use}
     - Foundation LP remains constant at $100,000
     """)
 
@@ -483,10 +607,19 @@ def show_overview_page(simulator: RPCfiSimulator):
     selected_apy = simulator.apy_scenarios[apy_scenario]
     st.info(f"Selected: **{apy_scenario.title()} Case** with **{selected_apy}% APY**")
     
+    # Drop results from a run with other settings, so the other tabs never show
+    # numbers that do not match the current selection
+    sim_inputs = (apy_scenario, simulator.growth_multiplier, simulator.expected_future_growth_multiplier)
+    if st.session_state.get('sim_inputs') != sim_inputs:
+        st.session_state.pop('sim_df', None)
+    
     # Run simulation
     if st.button("Run Simulation", type="primary"):
         with st.spinner("Running simulation..."):
             simulation_results = simulator.run_simulation(apy_scenario)
+        # Keep the results across reruns so the other tabs can show them
+        st.session_state['sim_df'] = simulation_results
+        st.session_state['sim_inputs'] = sim_inputs
         
         # Display summary metrics
         st.subheader("Simulation Summary")
@@ -494,19 +627,19 @@ def show_overview_page(simulator: RPCfiSimulator):
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_revenue = simulation_results['RPC_Revenue_USD'].sum()
+            total_revenue = simulation_results[Cols.REVENUE].sum()
             st.metric("Total RPC Revenue", f"${total_revenue:,.0f}")
         
         with col2:
-            total_buybacks = (simulation_results['TRX_Buyback_USD'] + simulation_results['ANKR_Buyback_USD']).sum()
+            total_buybacks = (simulation_results[Cols.TRX_BUYBACK] + simulation_results[Cols.ANKR_BUYBACK]).sum()
             st.metric("Total Buybacks", f"${total_buybacks:,.0f}")
         
         with col3:
-            final_lp_tvl = simulation_results['Total_LP_TVL_USD'].iloc[-1]
+            final_lp_tvl = simulation_results[Cols.TOTAL_TVL].iloc[-1]
             st.metric("Final LP TVL", f"${final_lp_tvl:,.0f}")
         
         with col4:
-            total_dev_yield = simulation_results['Cumulative_Dev_Yield_USD'].iloc[-1]
+            total_dev_yield = simulation_results[Cols.CUM_DEV_YIELD].iloc[-1]
             st.metric("Total Dev Yield", f"${total_dev_yield:,.0f}")
         
         # Growth assumptions
@@ -529,46 +662,48 @@ def show_overview_page(simulator: RPCfiSimulator):
         # Historical data summary
         if simulator.historical_data:
             st.subheader("Historical Revenue Data")
-            historical_df = pd.DataFrame(list(simulator.historical_data.items()), columns=['Month', 'Revenue (USD)'])
+            historical_df = pd.DataFrame({
+                'Month': list(simulator.historical_data.keys()),
+                'Revenue (USD)': np.fromiter(simulator.historical_data.values(), dtype=np.float64)
+            })
             st.dataframe(historical_df, use_container_width=True)
 
-def show_buyback_page(simulator: RPCfiSimulator):
-    """Display the buyback and LP flows page"""
-    st.header("Buyback & LP Flows")
-    
-    if simulator.simulation_data is None:
-        st.warning("Please run the simulation first from the Overview page.")
-        return
-    
-    # Weekly buyback amounts
-    st.subheader("Weekly Buyback Amounts")
+@st.cache_data
+def _build_buyback_figures(sim_df: pd.DataFrame, native_token: str, governance_token: str,
+                           foundation_lp_value: float) -> Tuple[go.Figure, go.Figure]:
+    """Build the buyback and LP TVL figures, reused across reruns"""
+    # Plain arrays plot without serializing a pandas index for every trace
+    dates = sim_df[Cols.DATE].to_numpy()
+    trx_buyback = sim_df[Cols.TRX_BUYBACK].to_numpy()
+    ankr_buyback = sim_df[Cols.ANKR_BUYBACK].to_numpy()
+    cumulative_dev_lp = sim_df[Cols.CUM_DEV_LP].to_numpy()
+    total_tvl = sim_df[Cols.TOTAL_TVL].to_numpy()
     
     fig = make_subplots(
         rows=2, cols=1,
-        subplot_titles=(f'{simulator.native_token} Buybacks', f'{simulator.governance_token} Buybacks'),
+        subplot_titles=(f'{native_token} Buybacks', f'{governance_token} Buybacks'),
         vertical_spacing=0.1
     )
     
-    fig.add_trace(
-        go.Scatter(
-            x=simulator.simulation_data['Date'],
-            y=simulator.simulation_data['TRX_Buyback_USD'],
-            mode='lines+markers',
-            name=f'{simulator.native_token} Buybacks',
-            line=dict(color='#e74c3c')
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=simulator.simulation_data['Date'],
-            y=simulator.simulation_data['ANKR_Buyback_USD'],
-            mode='lines+markers',
-            name=f'{simulator.governance_token} Buybacks',
-            line=dict(color='#3498db')
-        ),
-        row=2, col=1
+    # Add all traces in one call so the figure is validated once
+    fig.add_traces(
+        [
+            go.Scattergl(
+                x=dates,
+                y=trx_buyback,
+                mode='lines+markers',
+                name=f'{native_token} Buybacks',
+                line=dict(color='#e74c3c')
+            ),
+            go.Scattergl(
+                x=dates,
+                y=ankr_buyback,
+                mode='lines+markers',
+                name=f'{governance_token} Buybacks',
+                line=dict(color='#3498db')
+            )
+        ],
+        rows=[1, 2], cols=[1, 1]
     )
     
     fig.update_layout(
@@ -577,38 +712,30 @@ def show_buyback_page(simulator: RPCfiSimulator):
         title_text="Weekly Buyback Amounts (USD)"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # LP TVL Growth
-    st.subheader("LP TVL Growth")
-    
-    fig2 = go.Figure()
-    
-    fig2.add_trace(go.Scatter(
-        x=simulator.simulation_data['Date'],
-        y=simulator.simulation_data['Cumulative_RPCfi_LP_USD'],
-        mode='lines+markers',
-        name='RPCfi LP',
-        line=dict(color='#3498db', width=3)
-    ))
-    
-    # Add foundation LP (constant)
-    foundation_lp_value = sum(simulator.initial_lp.values())
-    fig2.add_trace(go.Scatter(
-        x=simulator.simulation_data['Date'],
-        y=[foundation_lp_value] * len(simulator.simulation_data),
-        mode='lines',
-        name='Foundation LP',
-        line=dict(color='#e74c3c', width=2, dash='dash')
-    ))
-    
-    fig2.add_trace(go.Scatter(
-        x=simulator.simulation_data['Date'],
-        y=simulator.simulation_data['Total_LP_TVL_USD'],
-        mode='lines+markers',
-        name='Total LP TVL',
-        line=dict(color='#2c3e50', width=3)
-    ))
+    fig2 = go.Figure(data=[
+        go.Scattergl(
+            x=dates,
+            y=cumulative_dev_lp,
+            mode='lines+markers',
+            name='RPCfi LP',
+            line=dict(color='#3498db', width=3)
+        ),
+        # Foundation LP (constant)
+        go.Scatter(
+            x=dates,
+            y=np.full(len(dates), foundation_lp_value),
+            mode='lines',
+            name='Foundation LP',
+            line=dict(color='#e74c3c', width=2, dash='dash')
+        ),
+        go.Scattergl(
+            x=dates,
+            y=total_tvl,
+            mode='lines+markers',
+            name='Total LP TVL',
+            line=dict(color='#2c3e50', width=3)
+        )
+    ])
     
     fig2.update_layout(
         title="Cumulative LP TVL Growth",
@@ -617,36 +744,61 @@ def show_buyback_page(simulator: RPCfiSimulator):
         height=500
     )
     
+    return fig, fig2
+
+def show_buyback_page(simulator: RPCfiSimulator):
+    """Display the buyback and LP flows page"""
+    st.header("Buyback & LP Flows")
+    
+    sim_df = st.session_state.get('sim_df')
+    if sim_df is None:
+        st.warning("Please run the simulation first from the Overview page.")
+        return
+    
+    # Weekly buyback amounts
+    st.subheader("Weekly Buyback Amounts")
+    
+    fig, fig2 = _build_buyback_figures(
+        sim_df,
+        simulator.native_token,
+        simulator.governance_token,
+        simulator.foundation_lp_value
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # LP TVL Growth
+    st.subheader("LP TVL Growth")
+    
     st.plotly_chart(fig2, use_container_width=True)
     
     # Weekly LP minted table
     st.subheader("Weekly LP Details")
     
-    display_data = simulator.simulation_data[['Date', 'Weekly_LP_Value_USD', 'Cumulative_RPCfi_LP_USD', 'Total_LP_TVL_USD']].copy()
-    display_data['Date'] = display_data['Date'].dt.strftime('%Y-%m-%d')
-    display_data = display_data.round(2)
+    # Only the displayed columns are serialized; column_config handles the rounding
+    display_data = sim_df[[Cols.DATE, Cols.WEEKLY_LP, Cols.CUM_DEV_LP, Cols.TOTAL_TVL]]
     
     st.dataframe(
         display_data,
         column_config={
-            "Date": "Date",
-            "Weekly_LP_Value_USD": st.column_config.NumberColumn("Weekly LP Minted (USD)", format="$%.2f"),
-            "Cumulative_RPCfi_LP_USD": st.column_config.NumberColumn("Cumulative RPCfi LP (USD)", format="$%.2f"),
-            "Total_LP_TVL_USD": st.column_config.NumberColumn("Total LP TVL (USD)", format="$%.2f")
+            Cols.DATE: st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD"),
+            Cols.WEEKLY_LP: st.column_config.NumberColumn("Weekly LP Minted (USD)", format="$%.2f"),
+            Cols.CUM_DEV_LP: st.column_config.NumberColumn("Cumulative RPCfi LP (USD)", format="$%.2f"),
+            Cols.TOTAL_TVL: st.column_config.NumberColumn("Total LP TVL (USD)", format="$%.2f")
         },
+        hide_index=True,
         use_container_width=True
     )
 
-def show_yield_page(simulator: RPCfiSimulator):
-    """Display the yield and revenue page"""
-    st.header("Yield & Revenue")
-    
-    if simulator.simulation_data is None:
-        st.warning("Please run the simulation first from the Overview page.")
-        return
-    
-    # Yield comparison
-    st.subheader("Weekly Yield Comparison")
+@st.cache_data
+def _build_yield_figure(sim_df: pd.DataFrame) -> go.Figure:
+    """Build the yield distribution figure, reused across reruns"""
+    # Plain arrays plot without serializing a pandas index for every trace
+    dates = sim_df[Cols.DATE].to_numpy()
+    dev_yield = sim_df[Cols.DEV_YIELD].to_numpy()
+    foundation_yield = sim_df[Cols.FOUNDATION_YIELD].to_numpy()
+    cumulative_dev_yield = sim_df[Cols.CUM_DEV_YIELD].to_numpy()
+    cumulative_foundation_yield = sim_df[Cols.CUM_FOUNDATION_YIELD].to_numpy()
     
     fig = make_subplots(
         rows=2, cols=1,
@@ -654,50 +806,41 @@ def show_yield_page(simulator: RPCfiSimulator):
         vertical_spacing=0.1
     )
     
-    fig.add_trace(
-        go.Scatter(
-            x=simulator.simulation_data['Date'],
-            y=simulator.simulation_data['Dev_Weekly_Yield_USD'],
-            mode='lines+markers',
-            name='Developer Weekly Yield',
-            line=dict(color='#3498db')
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=simulator.simulation_data['Date'],
-            y=simulator.simulation_data['Foundation_Weekly_Yield_USD'],
-            mode='lines+markers',
-            name='Foundation Weekly Yield',
-            line=dict(color='#e74c3c')
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=simulator.simulation_data['Date'],
-            y=simulator.simulation_data['Cumulative_Dev_Yield_USD'],
-            mode='lines+markers',
-            name='Cumulative Developer Yield',
-            line=dict(color='#3498db', width=3),
-            showlegend=False
-        ),
-        row=2, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=simulator.simulation_data['Date'],
-            y=simulator.simulation_data['Cumulative_Foundation_Yield_USD'],
-            mode='lines+markers',
-            name='Cumulative Foundation Yield',
-            line=dict(color='#e74c3c', width=3),
-            showlegend=False
-        ),
-        row=2, col=1
+    # Add all traces in one call so the figure is validated once
+    fig.add_traces(
+        [
+            go.Scattergl(
+                x=dates,
+                y=dev_yield,
+                mode='lines+markers',
+                name='Developer Weekly Yield',
+                line=dict(color='#3498db')
+            ),
+            go.Scattergl(
+                x=dates,
+                y=foundation_yield,
+                mode='lines+markers',
+                name='Foundation Weekly Yield',
+                line=dict(color='#e74c3c')
+            ),
+            go.Scattergl(
+                x=dates,
+                y=cumulative_dev_yield,
+                mode='lines+markers',
+                name='Cumulative Developer Yield',
+                line=dict(color='#3498db', width=3),
+                showlegend=False
+            ),
+            go.Scattergl(
+                x=dates,
+                y=cumulative_foundation_yield,
+                mode='lines+markers',
+                name='Cumulative Foundation Yield',
+                line=dict(color='#e74c3c', width=3),
+                showlegend=False
+            )
+        ],
+        rows=[1, 1, 2, 2], cols=[1, 1, 1, 1]
     )
     
     fig.update_layout(
@@ -706,6 +849,22 @@ def show_yield_page(simulator: RPCfiSimulator):
         title_text="Yield Distribution Over Time"
     )
     
+    return fig
+
+def show_yield_page(simulator: RPCfiSimulator):
+    """Display the yield and revenue page"""
+    st.header("Yield & Revenue")
+    
+    sim_df = st.session_state.get('sim_df')
+    if sim_df is None:
+        st.warning("Please run the simulation first from the Overview page.")
+        return
+    
+    # Yield comparison
+    st.subheader("Weekly Yield Comparison")
+    
+    fig = _build_yield_figure(sim_df)
+    
     st.plotly_chart(fig, use_container_width=True)
     
     # Yield summary metrics
@@ -714,38 +873,38 @@ def show_yield_page(simulator: RPCfiSimulator):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        final_dev_yield = simulator.simulation_data['Cumulative_Dev_Yield_USD'].iloc[-1]
+        final_dev_yield = sim_df[Cols.CUM_DEV_YIELD].iloc[-1]
         st.metric("Total Developer Yield", f"${final_dev_yield:,.0f}")
     
     with col2:
-        final_foundation_yield = simulator.simulation_data['Cumulative_Foundation_Yield_USD'].iloc[-1]
+        final_foundation_yield = sim_df[Cols.CUM_FOUNDATION_YIELD].iloc[-1]
         st.metric("Total Foundation Yield", f"${final_foundation_yield:,.0f}")
     
     with col3:
-        avg_weekly_dev_yield = simulator.simulation_data['Dev_Weekly_Yield_USD'].mean()
+        avg_weekly_dev_yield = sim_df[Cols.DEV_YIELD].mean()
         st.metric("Avg Weekly Dev Yield", f"${avg_weekly_dev_yield:,.0f}")
     
     with col4:
-        avg_weekly_foundation_yield = simulator.simulation_data['Foundation_Weekly_Yield_USD'].mean()
+        avg_weekly_foundation_yield = sim_df[Cols.FOUNDATION_YIELD].mean()
         st.metric("Avg Weekly Foundation Yield", f"${avg_weekly_foundation_yield:,.0f}")
     
     # Detailed yield table
     st.subheader("Detailed Yield Data")
     
-    yield_data = simulator.simulation_data[['Date', 'Dev_Weekly_Yield_USD', 'Foundation_Weekly_Yield_USD', 
-                                          'Cumulative_Dev_Yield_USD', 'Cumulative_Foundation_Yield_USD']].copy()
-    yield_data['Date'] = yield_data['Date'].dt.strftime('%Y-%m-%d')
-    yield_data = yield_data.round(2)
+    # Only the displayed columns are serialized; column_config handles the rounding
+    yield_data = sim_df[[Cols.DATE, Cols.DEV_YIELD, Cols.FOUNDATION_YIELD,
+                         Cols.CUM_DEV_YIELD, Cols.CUM_FOUNDATION_YIELD]]
     
     st.dataframe(
         yield_data,
         column_config={
-            "Date": "Date",
-            "Dev_Weekly_Yield_USD": st.column_config.NumberColumn("Dev Weekly Yield (USD)", format="$%.2f"),
-            "Foundation_Weekly_Yield_USD": st.column_config.NumberColumn("Foundation Weekly Yield (USD)", format="$%.2f"),
-            "Cumulative_Dev_Yield_USD": st.column_config.NumberColumn("Cumulative Dev Yield (USD)", format="$%.2f"),
-            "Cumulative_Foundation_Yield_USD": st.column_config.NumberColumn("Cumulative Foundation Yield (USD)", format="$%.2f")
+            Cols.DATE: st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD"),
+            Cols.DEV_YIELD: st.column_config.NumberColumn("Dev Weekly Yield (USD)", format="$%.2f"),
+            Cols.FOUNDATION_YIELD: st.column_config.NumberColumn("Foundation Weekly Yield (USD)", format="$%.2f"),
+            Cols.CUM_DEV_YIELD: st.column_config.NumberColumn("Cumulative Dev Yield (USD)", format="$%.2f"),
+            Cols.CUM_FOUNDATION_YIELD: st.column_config.NumberColumn("Cumulative Foundation Yield (USD)", format="$%.2f")
         },
+        hide_index=True,
         use_container_width=True
     )
 
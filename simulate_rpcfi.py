@@ -3,19 +3,167 @@
 RPCfi Data Generator - Helper script to generate synthetic RPC revenue data
 """
 
-import pandas as pd
 import numpy as np
 import json
-from datetime import datetime, timedelta
 import argparse
 import os
+import functools
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; output is then encoded with the stdlib json
+    orjson = None
+
+# Base monthly revenue (USD) and volatility for each named scenario
+_SCENARIO_PARAMS = {
+    "conservative": (12000, 0.02),
+    "moderate": (15000, 0.05),
+    "aggressive": (20000, 0.08),
+    "volatile": (15000, 0.15)
+}
+
+# Sample chain configurations written by create_sample_configs
+_CONFIG_TEMPLATES = {
+    "tron": {
+        "chain_name": "Tron",
+        "native_token": "TRX",
+        "rpcfi_partner": "Ankr",
+        "governance_token": "ANKR",
+        "base_currency": "USD",
+        "token_prices": {
+            "TRX": 0.12,
+            "ANKR": 0.025
+        },
+        "initial_lp": {
+            "Tron Foundation": 50000,
+            "Ankr Foundation": 50000
+        },
+        "growth_multiplier": 1.4,
+        "expected_future_growth_multiplier": 2.0,
+        "start_date": "2025-01-15",
+        "historical_window": {
+            "start": "2025-04-01",
+            "end": "2025-09-30"
+        },
+        "apy_settings": {
+            "foundation_base_apy": 10.0,
+            "developer_base_apy": 12.0,
+            "veboost_factor": 1.8
+        }
+    },
+    "ethereum": {
+        "chain_name": "Ethereum",
+        "native_token": "ETH",
+        "rpcfi_partner": "Ankr",
+        "governance_token": "ANKR",
+        "base_currency": "USD",
+        "token_prices": {
+            "ETH": 2500.0,
+            "ANKR": 0.025
+        },
+        "initial_lp": {
+            "Ethereum Foundation": 50000,
+            "Ankr Foundation": 50000
+        },
+        "growth_multiplier": 1.2,
+        "expected_future_growth_multiplier": 1.8,
+        "start_date": "2025-01-15",
+        "historical_window": {
+            "start": "2025-04-01",
+            "end": "2025-09-30"
+        },
+        "apy_settings": {
+            "foundation_base_apy": 8.0,
+            "developer_base_apy": 10.0,
+            "veboost_factor": 1.6
+        }
+    },
+    "polygon": {
+        "chain_name": "Polygon",
+        "native_token": "MATIC",
+        "rpcfi_partner": "Ankr",
+        "governance_token": "ANKR",
+        "base_currency": "USD",
+        "token_prices": {
+            "MATIC": 0.85,
+            "ANKR": 0.025
+        },
+        "initial_lp": {
+            "Polygon Foundation": 50000,
+            "Ankr Foundation": 50000
+        },
+        "growth_multiplier": 1.5,
+        "expected_future_growth_multiplier": 2.2,
+        "start_date": "2025-01-15",
+        "historical_window": {
+            "start": "2025-04-01",
+            "end": "2025-09-30"
+        },
+        "apy_settings": {
+            "foundation_base_apy": 12.0,
+            "developer_base_apy": 15.0,
+            "veboost_factor": 2.0
+        }
+    }
+}
+
+@functools.lru_cache(maxsize=32)
+def _month_labels(start_month: str, end_month: str) -> Tuple[str, ...]:
+    """YYYY-MM labels for every month from start_month to end_month inclusive"""
+    # Cached (and returned as a tuple) since every scenario reuses the same window
+    first, last = (datetime.strptime(month, "%Y-%m") for month in (start_month, end_month))
+    months = np.arange(np.datetime64(first, 'M'), np.datetime64(last, 'M') + 1)
+    return tuple(np.datetime_as_string(months, unit='M').tolist())
+
+def _standard_noise(rng: np.random.Generator, shape) -> np.ndarray:
+    """Standard-normal deviates for the volatility factor"""
+    # Revenue is rounded to the nearest thousand, so float32 deviates are ample
+    return rng.standard_normal(shape, dtype=np.float32)
+
+def _synthetic_revenue(
+    base_revenue,
+    growth_rate,
+    volatility,
+    noise: np.ndarray
+) -> np.ndarray:
+    """
+    Turn pre-drawn deviates into synthetic monthly revenue for one or more scenarios
+    
+    base_revenue, growth_rate and volatility may be scalars or 1-D arrays
+    (one entry per scenario); noise and the result have shape (n_scenarios, n_months).
+    """
+    n_scenarios, n_months = noise.shape
+    # One column per parameter, so it broadcasts along each scenario's months
+    base_revenue, growth_rate, volatility = (
+        np.broadcast_to(np.asarray(param, dtype=float), n_scenarios)[:, None]
+        for param in (base_revenue, growth_rate, volatility)
+    )
+    
+    # Add random volatility (one float64 buffer, updated in place from here on)
+    monthly_revenue = np.multiply(volatility, noise, dtype=float)
+    monthly_revenue += 1.0
+    
+    # Calculate base revenue with growth
+    growth = (1 + growth_rate) ** np.arange(n_months)
+    growth *= base_revenue
+    monthly_revenue *= growth
+    
+    # Ensure positive revenue
+    np.maximum(monthly_revenue, base_revenue * 0.5, out=monthly_revenue)
+    
+    # Round to nearest thousand
+    return np.round(monthly_revenue, -3, out=monthly_revenue)
 
 def generate_synthetic_revenue_data(
     start_month: str = "2025-04",
     end_month: str = "2025-09",
     base_revenue: float = 15000,
     growth_rate: float = 0.0,
-    volatility: float = 0.05
+    volatility: float = 0.05,
+    rng: Optional[np.random.Generator] = None
 ) -> dict:
     """
     Generate synthetic RPC revenue data with flat revenue (no growth assumptions)
@@ -26,189 +174,117 @@ def generate_synthetic_revenue_data(
         base_revenue: Base monthly revenue in USD
         growth_rate: Monthly growth rate (0.0 = no growth)
         volatility: Random volatility factor (0.05 = 5% random variation)
+        rng: Random generator to draw from (a fresh one is created if omitted)
     
     Returns:
         Dictionary with month-revenue pairs
     """
-    # Parse dates
-    start_date = datetime.strptime(start_month, "%Y-%m")
-    end_date = datetime.strptime(end_month, "%Y-%m")
-    
-    # Generate months
-    current_date = start_date
-    revenue_data = {}
-    month_count = 0
-    
-    while current_date <= end_date:
-        # Calculate base revenue with growth
-        monthly_revenue = base_revenue * ((1 + growth_rate) ** month_count)
-        
-        # Add random volatility
-        random_factor = np.random.normal(1.0, volatility)
-        monthly_revenue *= random_factor
-        
-        # Ensure positive revenue
-        monthly_revenue = max(monthly_revenue, base_revenue * 0.5)
-        
-        # Round to nearest thousand
-        monthly_revenue = round(monthly_revenue, -3)
-        
-        # Store data
-        month_key = current_date.strftime("%Y-%m")
-        revenue_data[month_key] = monthly_revenue
-        
-        # Move to next month
-        if current_date.month == 12:
-            current_date = current_date.replace(year=current_date.year + 1, month=1)
-        else:
-            current_date = current_date.replace(month=current_date.month + 1)
-        
-        month_count += 1
+    months = _month_labels(start_month, end_month)
+    monthly_revenue = generate_synthetic_revenue_paths(
+        start_month, end_month, base_revenue, growth_rate, volatility, n_paths=1, rng=rng
+    )[0]
+    return dict(zip(months, monthly_revenue.tolist()))
+
+def generate_synthetic_revenue_paths(
+    start_month: str = "2025-04",
+    end_month: str = "2025-09",
+    base_revenue: float = 15000,
+    growth_rate: float = 0.0,
+    volatility: float = 0.05,
+    n_paths: int = 1,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Generate many independent synthetic revenue paths in one batched draw
     
-    return revenue_data
+    Takes the same arguments as generate_synthetic_revenue_data, plus n_paths.
+    
+    Returns:
+        Array of shape (n_paths, n_months); columns follow the months from
+        start_month to end_month
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    n_months = len(_month_labels(start_month, end_month))
+    noise = _standard_noise(rng, (n_paths, n_months))
+    return _synthetic_revenue(base_revenue, growth_rate, volatility, noise)
 
-def generate_multiple_scenarios() -> dict:
+def generate_multiple_scenarios(rng: Optional[np.random.Generator] = None) -> dict:
     """Generate multiple revenue scenarios for comparison"""
+    months, revenue = _scenario_revenue(rng)
     scenarios = {
-        "conservative": generate_synthetic_revenue_data(
-            base_revenue=12000,
-            growth_rate=0.0,
-            volatility=0.02
-        ),
-        "moderate": generate_synthetic_revenue_data(
-            base_revenue=15000,
-            growth_rate=0.0,
-            volatility=0.05
-        ),
-        "aggressive": generate_synthetic_revenue_data(
-            base_revenue=20000,
-            growth_rate=0.0,
-            volatility=0.08
-        ),
-        "volatile": generate_synthetic_revenue_data(
-            base_revenue=15000,
-            growth_rate=0.0,
-            volatility=0.15
-        )
+        name: dict(zip(months, row.tolist()))
+        for name, row in zip(_SCENARIO_PARAMS, revenue)
     }
     return scenarios
 
+def _scenario_revenue(rng: Optional[np.random.Generator]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Month labels and a (n_scenarios, n_months) revenue array, in _SCENARIO_PARAMS order"""
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    bases, vols = np.array(list(_SCENARIO_PARAMS.values())).T
+    months = _month_labels("2025-04", "2025-09")
+    
+    # Each scenario gets its own child stream spawned from rng, so its path does not
+    # depend on how many scenarios come before it; the rest is one batched pass
+    noise = np.stack([_standard_noise(child, len(months)) for child in rng.spawn(len(bases))])
+    revenue = _synthetic_revenue(bases, 0.0, vols, noise)
+    
+    return months, revenue
+
 def save_to_csv(revenue_data: dict, filename: str):
     """Save revenue data to CSV file"""
-    df = pd.DataFrame(list(revenue_data.items()), columns=['Month', 'RPC_Revenue_USD'])
-    df.to_csv(filename, index=False)
+    _write_revenue_csv(tuple(revenue_data), np.fromiter(revenue_data.values(), dtype=float), filename)
     print(f"Revenue data saved to {filename}")
 
+def _write_revenue_csv(months: Tuple[str, ...], revenue: np.ndarray, filename: str):
+    """Write month labels and a revenue array to CSV file, without printing"""
+    rows = np.rec.fromarrays([np.asarray(months), revenue], names=['Month', 'RPC_Revenue_USD'])
+    np.savetxt(filename, rows, fmt='%s', delimiter=',',
+               header='Month,RPC_Revenue_USD', comments='')
+
 def save_to_json(revenue_data: dict, filename: str):
     """Save revenue data to JSON file"""
-    with open(filename, 'w') as f:
-        json.dump(revenue_data, f, indent=2)
+    _write_json(revenue_data, filename)
     print(f"Revenue data saved to {filename}")
 
+def _write_json(revenue_data: dict, filename: str):
+    """Write the JSON behind save_to_json, without printing"""
+    # Encode up front so the file is written in a single call
+    if orjson is not None:
+        payload = orjson.dumps(revenue_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(revenue_data, indent=2).encode()
+    with open(filename, 'wb') as f:
+        f.write(payload)
+
+def _write_config(chain: str, config: dict) -> str:
+    """Write one sample configuration file and return its name"""
+    filename = f"config_{chain}.json"
+    with open(filename, 'w') as f:
+        json.dump(config, f, indent=2)
+    return filename
+
 def create_sample_configs():
     """Create sample configuration files for different chains"""
-    configs = {
-        "tron": {
-            "chain_name": "Tron",
-            "native_token": "TRX",
-            "rpcfi_partner": "Ankr",
-            "governance_token": "ANKR",
-            "base_currency": "USD",
-            "token_prices": {
-                "TRX": 0.12,
-                "ANKR": 0.025,
-                "ANKR": 0.025
-            },
-            "initial_lp": {
-                "Tron Foundation": 50000,
-                "Ankr Foundation": 50000
-            },
-            "growth_multiplier": 1.4,
-            "expected_future_growth_multiplier": 2.0,
-            "start_date": "2025-01-15",
-            "historical_window": {
-                "start": "2025-04-01",
-                "end": "2025-09-30"
-            },
-            "apy_settings": {
-                "foundation_base_apy": 10.0,
-                "developer_base_apy": 12.0,
-                "veboost_factor": 1.8
-            }
-        },
-        "ethereum": {
-            "chain_name": "Ethereum",
-            "native_token": "ETH",
-            "rpcfi_partner": "Ankr",
-            "governance_token": "ANKR",
-            "base_currency": "USD",
-            "token_prices": {
-                "ETH": 2500.0,
-                "ANKR": 0.025,
-                "ANKR": 0.025
-            },
-            "initial_lp": {
-                "Ethereum Foundation": 50000,
-                "Ankr Foundation": 50000
-            },
-            "growth_multiplier": 1.2,
-            "expected_future_growth_multiplier": 1.8,
-            "start_date": "2025-01-15",
-            "historical_window": {
-                "start": "2025-04-01",
-                "end": "2025-09-30"
-            },
-            "apy_settings": {
-                "foundation_base_apy": 8.0,
-                "developer_base_apy": 10.0,
-                "veboost_factor": 1.6
-            }
-        },
-        "polygon": {
-            "chain_name": "Polygon",
-            "native_token": "MATIC",
-            "rpcfi_partner": "Ankr",
-            "governance_token": "ANKR",
-            "base_currency": "USD",
-            "token_prices": {
-                "MATIC": 0.85,
-                "ANKR": 0.025,
-                "ANKR": 0.025
-            },
-            "initial_lp": {
-                "Polygon Foundation": 50000,
-                "Ankr Foundation": 50000
-            },
-            "growth_multiplier": 1.5,
-            "expected_future_growth_multiplier": 2.2,
-            "start_date": "2025-01-15",
-            "historical_window": {
-                "start": "2025-04-01",
-                "end": "2025-09-30"
-            },
-            "apy_settings": {
-                "foundation_base_apy": 12.0,
-                "developer_base_apy": 15.0,
-                "veboost_factor": 2.0
-            }
-        }
-    }
-    
-    for chain, config in configs.items():
-        filename = f"config_{chain}.json"
-        with open(filename, 'w') as f:
-            json.dump(config, f, indent=2)
-        print(f"Created {filename}")
+    # The files are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=len(_CONFIG_TEMPLATES)) as executor:
+        for filename in executor.map(_write_config, _CONFIG_TEMPLATES, _CONFIG_TEMPLATES.values()):
+            print(f"Created {filename}")
 
 def main():
     parser = argparse.ArgumentParser(description="Generate synthetic RPCfi revenue data")
-    parser.add_argument("--scenario", choices=["conservative", "moderate", "aggressive", "volatile", "all"], 
+    parser.add_argument("--scenario", choices=[*_SCENARIO_PARAMS, "all"], 
                        default="moderate", help="Revenue scenario to generate")
     parser.add_argument("--format", choices=["csv", "json", "both"], default="both", 
                        help="Output format")
     parser.add_argument("--output", default="revenue_data", help="Output filename prefix")
     parser.add_argument("--create-configs", action="store_true", 
                        help="Create sample configuration files")
+    parser.add_argument("--seed", type=int, default=None,
+                       help="Random seed for reproducible output")
     
     args = parser.parse_args()
     
@@ -217,32 +293,45 @@ def main():
         create_sample_configs()
         return
     
+    rng = np.random.default_rng(args.seed)
+    
     if args.scenario == "all":
-        scenarios = generate_multiple_scenarios()
-        for scenario_name, revenue_data in scenarios.items():
+        months, revenue = _scenario_revenue(rng)
+        totals = revenue.sum(axis=1)
+        tasks = []
+        for scenario_name, row, total in zip(_SCENARIO_PARAMS, revenue, totals):
             print(f"\nGenerating {scenario_name} scenario:")
-            print(f"Total 6-month revenue: ${sum(revenue_data.values()):,.0f}")
+            print(f"Total 6-month revenue: ${total:,.0f}")
             
             if args.format in ["csv", "both"]:
-                save_to_csv(revenue_data, f"{args.output}_{scenario_name}.csv")
+                tasks.append((_write_revenue_csv, months, row, f"{args.output}_{scenario_name}.csv"))
             if args.format in ["json", "both"]:
-                save_to_json(revenue_data, f"{args.output}_{scenario_name}.json")
+                revenue_data = dict(zip(months, row.tolist()))
+                tasks.append((_write_json, revenue_data, f"{args.output}_{scenario_name}.json"))
+        
+        # The files are independent, so write them concurrently; report them from
+        # here, in task order, so the output does not depend on thread timing
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(write, *write_args) for write, *write_args in tasks]
+            for future, (*_, filename) in zip(futures, tasks):
+                future.result()
+                print(f"Revenue data saved to {filename}")
     else:
-        # Generate single scenario
-        if args.scenario == "conservative":
-            revenue_data = generate_synthetic_revenue_data(base_revenue=12000, growth_rate=0.0, volatility=0.02)
-        elif args.scenario == "moderate":
-            revenue_data = generate_synthetic_revenue_data(base_revenue=15000, growth_rate=0.0, volatility=0.05)
-        elif args.scenario == "aggressive":
-            revenue_data = generate_synthetic_revenue_data(base_revenue=20000, growth_rate=0.0, volatility=0.08)
-        elif args.scenario == "volatile":
-            revenue_data = generate_synthetic_revenue_data(base_revenue=15000, growth_rate=0.0, volatility=0.15)
+        # Generate single scenario, from the same child stream "all" would give it,
+        # so one --seed reproduces the same numbers either way
+        base_revenue, volatility = _SCENARIO_PARAMS[args.scenario]
+        child = rng.spawn(len(_SCENARIO_PARAMS))[list(_SCENARIO_PARAMS).index(args.scenario)]
+        months = _month_labels("2025-04", "2025-09")
+        revenue = generate_synthetic_revenue_paths(
+            "2025-04", "2025-09", base_revenue, 0.0, volatility, n_paths=1, rng=child
+        )[0]
+        revenue_data = dict(zip(months, revenue.tolist()))
         
         print(f"Generated {args.scenario} scenario:")
-        print(f"Total 6-month revenue: ${sum(revenue_data.values()):,.0f}")
+        print(f"Total 6-month revenue: ${revenue.sum():,.0f}")
         print("\nMonthly breakdown:")
-        for month, revenue in revenue_data.items():
-            print(f"  {month}: ${revenue:,.0f}")
+        for month, monthly_revenue in revenue_data.items():
+            print(f"  {month}: ${monthly_revenue:,.0f}")
         
         if args.format in ["csv", "both"]:
             save_to_csv(revenue_data, f"{args.output}_{args.scenario}.csv")